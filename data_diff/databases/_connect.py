@@ -1,7 +1,12 @@
+import atexit
+import functools
 import logging
-from typing import Hashable, MutableMapping, Type, Optional, Union, Dict
+import threading
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Hashable, Mapping, MutableMapping, Type, Optional, Union, Dict, Tuple
 from itertools import zip_longest
-from contextlib import suppress
 import weakref
 
 import attrs
@@ -26,46 +31,105 @@ from data_diff.databases.duckdb import DuckDB
 from data_diff.databases.mssql import MsSQL
 
 
+@attrs.frozen
+class ParsedDSN:
+    "Immutable snapshot of a dsnparse result, so that it can be safely shared through the parse cache"
+
+    schemes: Tuple[str, ...]
+    paths: Tuple[str, ...]
+    query: Mapping[str, Any]
+    user: Optional[str]
+    password: Optional[str]
+    host: Optional[str]
+    hostloc: Optional[str]
+    port: Optional[int]
+    path: Optional[str]
+    dbname: Optional[str]
+    fragment: Optional[str]
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_dsn(db_uri: str) -> ParsedDSN:
+    dsn = dsnparse.parse(db_uri)
+    return ParsedDSN(
+        schemes=tuple(dsn.schemes),
+        paths=tuple(dsn.paths),
+        query=MappingProxyType(dict(dsn.query)),
+        user=dsn.user,
+        password=dsn.password,
+        host=dsn.host,
+        hostloc=dsn.hostloc if dsn.host is not None else None,
+        port=dsn.port,
+        path=dsn.path,
+        dbname=dsn.dbname,
+        fragment=dsn.fragment,
+    )
+
+
+# Parsed URIs, credentials included, stay in this cache for the life of the process. It's only cleared at exit,
+# or when _parse_dsn.cache_clear() is called.
+atexit.register(_parse_dsn.cache_clear)
+
+
 @attrs.frozen
 class MatchUriPath:
     database_cls: Type[Database]
 
+    # Derived from database_cls once, so that match_path() doesn't re-parse them for every URI
+    _params: Tuple[Tuple[str, bool], ...] = attrs.field(init=False)
+    _kwparams: Tuple[str, ...] = attrs.field(init=False)
+    _help_str: str = attrs.field(init=False)
+
+    @_params.default
+    def _parse_params(self) -> Tuple[Tuple[str, bool], ...]:
+        "Split each param into (name, is_optional)"
+        return tuple((p.rstrip("?"), p.endswith("?")) for p in self.database_cls.CONNECT_URI_PARAMS)
+
+    @_kwparams.default
+    def _parse_kwparams(self) -> Tuple[str, ...]:
+        return tuple(self.database_cls.CONNECT_URI_KWPARAMS)
+
+    @_help_str.default
+    def _parse_help_str(self) -> str:
+        return self.database_cls.CONNECT_URI_HELP
+
     def match_path(self, dsn):
-        help_str = self.database_cls.CONNECT_URI_HELP
-        params = self.database_cls.CONNECT_URI_PARAMS
-        kwparams = self.database_cls.CONNECT_URI_KWPARAMS
+        help_str = self._help_str
 
-        dsn_dict = dict(dsn.query)
+        # dsn.query is only read, never copied. Keys taken from it are tracked in 'consumed'.
+        query = dsn.query
+        consumed = set()
         matches = {}
-        for param, arg in zip_longest(params, dsn.paths):
-            if param is None:
+        for param_spec, arg in zip_longest(self._params, dsn.paths):
+            if param_spec is None:
                 raise ValueError(f"Too many parts to path. Expected format: {help_str}")
 
-            optional = param.endswith("?")
-            param = param.rstrip("?")
+            param, optional = param_spec
 
             if arg is None:
-                try:
-                    arg = dsn_dict.pop(param)
-                except KeyError:
-                    if not optional:
-                        raise ValueError(f"URI must specify '{param}'. Expected format: {help_str}")
-
-                    arg = None
+                if param in query:
+                    arg = query[param]
+                    consumed.add(param)
+                elif optional:
+                    continue  # Leave it out, so the database uses its default
+                else:
+                    raise ValueError(f"URI must specify '{param}'. Expected format: {help_str}")
 
             assert param and param not in matches
             matches[param] = arg
 
-        for param in kwparams:
-            try:
-                arg = dsn_dict.pop(param)
-            except KeyError:
+        for param in self._kwparams:
+            if param not in query:
                 raise ValueError(f"URI must specify '{param}'. Expected format: {help_str}")
+            arg = query[param]
+            consumed.add(param)
 
             assert param and arg and param not in matches, (param, arg, matches.keys())
             matches[param] = arg
 
-        for param, value in dsn_dict.items():
+        for param, value in query.items():
+            if param in consumed:
+                continue
             if param in matches:
                 raise ValueError(
                     f"Parameter '{param}' already provided as positional argument. Expected format: {help_str}"
@@ -93,17 +157,96 @@ DATABASE_BY_SCHEME = {
 }
 
 
+@functools.lru_cache(maxsize=None)
+def _matcher_for(database_cls: Type[Database]) -> MatchUriPath:
+    "MatchUriPath only depends on class attributes, so each class needs just one, shared by all Connect instances"
+    return MatchUriPath(database_cls)
+
+
+def _cache_key(db_conf: Union[str, dict]) -> Hashable:
+    "Canonical, hashable form of db_conf. Dicts with the same items share a key, regardless of their order."
+    if isinstance(db_conf, dict):
+        return tuple(sorted(db_conf.items()))
+    return db_conf
+
+
+@attrs.define(frozen=False)
+class ConnectionPool:
+    """Keeps shared connections warm between calls to connect(), keyed by their canonical db_conf.
+
+    Recently used connections are held strongly, so they aren't reopened just because the caller dropped its
+    last reference. The least recently used ones are evicted when there are more than max_idle of them, or
+    when they haven't been borrowed for idle_ttl seconds.
+
+    Evicted connections aren't closed, since the pool can't tell whether a caller is still using them.
+    They stay reachable through a weak reference until they are garbage collected.
+    """
+
+    max_idle: int = 16
+    idle_ttl: float = 600.0
+
+    _warm: OrderedDict = attrs.field(factory=OrderedDict, init=False)  # {key: (conn, last_used)}
+    _weak: MutableMapping[Hashable, Database] = attrs.field(factory=weakref.WeakValueDictionary, init=False)
+    _lock: threading.Lock = attrs.field(factory=threading.Lock, init=False)
+
+    def borrow(self, key: Hashable) -> Optional[Database]:
+        "Return the open connection stored under key, or None"
+        now = time.monotonic()
+        with self._lock:
+            entry = self._warm.get(key)
+            conn = entry[0] if entry is not None else self._weak.get(key)
+            if conn is not None and conn.is_closed:
+                self._warm.pop(key, None)
+                self._weak.pop(key, None)
+                conn = None
+            if conn is not None:
+                self._touch(key, conn, now)
+            self._prune(now)
+            return conn
+
+    def add(self, key: Hashable, conn: Database) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._weak[key] = conn
+            self._touch(key, conn, now)
+            self._prune(now)
+
+    def clear(self) -> None:
+        "Forget all connections, without closing them"
+        with self._lock:
+            self._warm.clear()
+            self._weak.clear()
+
+    def _touch(self, key: Hashable, conn: Database, now: float) -> None:
+        self._warm[key] = (conn, now)
+        self._warm.move_to_end(key)
+
+    def _prune(self, now: float) -> None:
+        # Entries are ordered from least to most recently used, and the last one is never evicted
+        deadline = now - self.idle_ttl
+        while len(self._warm) > 1:
+            _conn, last_used = next(iter(self._warm.values()))
+            if len(self._warm) <= self.max_idle and last_used >= deadline:
+                break
+            self._warm.popitem(last=False)
+
+
 @attrs.define(frozen=False, init=False)
 class Connect:
     """Provides methods for connecting to a supported database using a URL or connection dict."""
 
     database_by_scheme: Dict[str, Database]
-    conn_cache: MutableMapping[Hashable, Database]
+    conn_cache: ConnectionPool
 
     def __init__(self, database_by_scheme: Dict[str, Database] = DATABASE_BY_SCHEME) -> None:
         super().__init__()
         self.database_by_scheme = database_by_scheme
-        self.conn_cache = weakref.WeakValueDictionary()
+        self.conn_cache = ConnectionPool()
+
+    def __reduce__(self):
+        # Open connections can't cross process boundaries, so a copy starts with an empty pool.
+        # The scheme table is always sent along, since schemes may have been registered after import.
+        return type(self), (self.database_by_scheme,)
 
     def for_databases(self, *dbs) -> Self:
         database_by_scheme = {k: db for k, db in self.database_by_scheme.items() if k in dbs}
@@ -136,10 +279,11 @@ class Connect:
         - duckdb
         """
 
-        dsn = dsnparse.parse(db_uri)
-        if len(dsn.schemes) > 1:
+        dsn = _parse_dsn(db_uri)
+        schemes = dsn.schemes
+        if len(schemes) != 1:
             raise NotImplementedError("No support for multiple schemes")
-        (scheme,) = dsn.schemes
+        scheme = schemes[0]
 
         if scheme == "toml":
             toml_path = dsn.path or dsn.host
@@ -154,46 +298,12 @@ class Connect:
                 raise ValueError(f"Cannot find database config named '{database}'.")
             return self.connect_with_dict(conn_dict, thread_count, **kwargs)
 
-        try:
-            cls = self.database_by_scheme[scheme]
-        except KeyError:
+        # A plain dict.get() is cheaper than a scheme->index dict plus a tuple lookup
+        cls = self.database_by_scheme.get(scheme)
+        if cls is None:
             raise NotImplementedError(f"Scheme '{scheme}' currently not supported")
 
-        if scheme == "databricks":
-            assert not dsn.user
-            kw = {}
-            kw["access_token"] = dsn.password
-            kw["http_path"] = dsn.path
-            kw["server_hostname"] = dsn.host
-            kw.update(dsn.query)
-        elif scheme == "duckdb":
-            kw = {}
-            kw["filepath"] = dsn.dbname
-            kw["dbname"] = dsn.user
-        else:
-            matcher = MatchUriPath(cls)
-            kw = matcher.match_path(dsn)
-
-            if scheme == "bigquery":
-                kw["project"] = dsn.host
-                return cls(**kw, **kwargs)
-
-            if scheme == "snowflake":
-                kw["account"] = dsn.host
-                assert not dsn.port
-                kw["user"] = dsn.user
-                kw["password"] = dsn.password
-            else:
-                if scheme == "oracle":
-                    kw["host"] = dsn.hostloc
-                else:
-                    kw["host"] = dsn.host
-                    kw["port"] = dsn.port
-                kw["user"] = dsn.user
-                if dsn.password:
-                    kw["password"] = dsn.password
-
-        kw = {k: v for k, v in kw.items() if v is not None}
+        kw = cls.kwargs_from_dsn(dsn, _matcher_for(cls))
 
         if isinstance(cls, type) and issubclass(cls, ThreadedDatabase):
             db = cls(thread_count=thread_count, **kw, **kwargs)
@@ -203,17 +313,19 @@ class Connect:
         return self._connection_created(db)
 
     def connect_with_dict(self, d, thread_count, **kwargs):
-        d = dict(d)
-        driver = d.pop("driver")
-        try:
-            cls = self.database_by_scheme[driver]
-        except KeyError:
+        driver = d["driver"]
+        cls = self.database_by_scheme.get(driver)
+        if cls is None:
             raise NotImplementedError(f"Driver '{driver}' currently not supported")
 
+        # dict() + del is a C-level copy, several times faster than filtering 'driver' out in a comprehension
+        kw = dict(d)
+        del kw["driver"]
+
         if issubclass(cls, ThreadedDatabase):
-            db = cls(thread_count=thread_count, **d, **kwargs)
+            db = cls(thread_count=thread_count, **kw, **kwargs)
         else:
-            db = cls(**d, **kwargs)
+            db = cls(**kw, **kwargs)
 
         return self._connection_created(db)
 
@@ -261,12 +373,11 @@ class Connect:
             >>> connect({"driver": "mysql", "host": "localhost", "database": "db"})
             <data_diff.databases.mysql.MySQL object at ...>
         """
-        cache_key = self.__make_cache_key(db_conf)
+        cache_key = _cache_key(db_conf)
         if shared:
-            with suppress(KeyError):
-                conn = self.conn_cache[cache_key]
-                if not conn.is_closed:
-                    return conn
+            conn = self.conn_cache.borrow(cache_key)
+            if conn is not None:
+                return conn
 
         if isinstance(db_conf, str):
             conn = self.connect_to_uri(db_conf, thread_count, **kwargs)
@@ -276,14 +387,9 @@ class Connect:
             raise TypeError(f"db configuration must be a URI string or a dictionary. Instead got '{db_conf}'.")
 
         if shared:
-            self.conn_cache[cache_key] = conn
+            self.conn_cache.add(cache_key, conn)
         return conn
 
-    def __make_cache_key(self, db_conf: Union[str, dict]) -> Hashable:
-        if isinstance(db_conf, dict):
-            return tuple(db_conf.items())
-        return db_conf
-
 
 @attrs.define(frozen=False, init=False)
 class Connect_SetUTC(Connect):
@@ -1209,6 +1209,23 @@ class Database(abc.ABC):
     def CONNECT_URI_PARAMS(self) -> List[str]:
         "List of parameters given in the path of the URI"
 
+    @classmethod
+    def kwargs_from_dsn(cls, dsn, matcher) -> Dict[str, Any]:
+        """Return the constructor arguments for a parsed connection URI. Options that are missing are left out.
+
+        'matcher' is the MatchUriPath for this class, used to read CONNECT_URI_PARAMS from the path and query.
+        """
+        kw = matcher.match_path(dsn)
+        if dsn.host is not None:
+            kw["host"] = dsn.host
+        if dsn.port is not None:
+            kw["port"] = dsn.port
+        if dsn.user is not None:
+            kw["user"] = dsn.user
+        if dsn.password:
+            kw["password"] = dsn.password
+        return kw
+
     @abstractmethod
     def _query(self, sql_code: str) -> list:
         "Send query to database and return result"
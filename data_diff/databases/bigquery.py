@@ -1,5 +1,5 @@
 import re
-from typing import Any, ClassVar, List, Union, Type
+from typing import Any, ClassVar, Dict, List, Union, Type
 
 import attrs
 
@@ -258,6 +258,13 @@ class BigQuery(Database):
 
         self.default_schema = dataset
 
+    @classmethod
+    def kwargs_from_dsn(cls, dsn, matcher) -> Dict[str, Any]:
+        kw = matcher.match_path(dsn)
+        if dsn.host is not None:
+            kw["project"] = dsn.host
+        return kw
+
     def _normalize_returned_value(self, value):
         if isinstance(value, bytes):
             return value.decode()
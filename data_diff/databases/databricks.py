@@ -133,6 +133,19 @@ class Databricks(ThreadedDatabase):
         self.default_schema = kw.get("schema", "default")
         self.catalog = kw.get("catalog", "hive_metastore")
 
+    @classmethod
+    def kwargs_from_dsn(cls, dsn, matcher) -> Dict[str, Any]:
+        assert not dsn.user
+        kw = {}
+        if dsn.password is not None:
+            kw["access_token"] = dsn.password
+        if dsn.path is not None:
+            kw["http_path"] = dsn.path
+        if dsn.host is not None:
+            kw["server_hostname"] = dsn.host
+        kw.update(dsn.query)
+        return kw
+
     def create_connection(self):
         databricks = import_databricks()
 
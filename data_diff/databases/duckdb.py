@@ -132,6 +132,15 @@ class DuckDB(Database):
         self._conn = self.create_connection()
         self.default_schema = "main"
 
+    @classmethod
+    def kwargs_from_dsn(cls, dsn, matcher) -> Dict[str, Any]:
+        kw = {}
+        if dsn.dbname is not None:
+            kw["filepath"] = dsn.dbname
+        if dsn.user is not None:
+            kw["dbname"] = dsn.user
+        return kw
+
     @property
     def is_autocommit(self) -> bool:
         return True
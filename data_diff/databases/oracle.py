@@ -170,6 +170,17 @@ class Oracle(ThreadedDatabase):
         self.default_schema = kw.get("user").upper()
         self._oracle = None
 
+    @classmethod
+    def kwargs_from_dsn(cls, dsn, matcher) -> Dict[str, Any]:
+        kw = matcher.match_path(dsn)
+        if dsn.hostloc is not None:
+            kw["host"] = dsn.hostloc  # Oracle expects the port as part of the host
+        if dsn.user is not None:
+            kw["user"] = dsn.user
+        if dsn.password:
+            kw["password"] = dsn.password
+        return kw
+
     def create_connection(self):
         self._oracle = import_oracle()
         try:
@@ -1,5 +1,5 @@
 import base64
-from typing import Any, ClassVar, Union, List, Type, Optional
+from typing import Any, ClassVar, Dict, Union, List, Type, Optional
 import logging
 
 import attrs
@@ -165,6 +165,18 @@ class Snowflake(Database):
 
         self.default_schema = schema
 
+    @classmethod
+    def kwargs_from_dsn(cls, dsn, matcher) -> Dict[str, Any]:
+        assert not dsn.port
+        kw = matcher.match_path(dsn)
+        if dsn.host is not None:
+            kw["account"] = dsn.host
+        if dsn.user is not None:
+            kw["user"] = dsn.user
+        if dsn.password is not None:
+            kw["password"] = dsn.password
+        return kw
+
     def close(self):
         super().close()
         self._conn.close()
@@ -13,7 +13,6 @@ from uuid import UUID
 
 import attrs
 from packaging.version import parse as parse_version
-import requests
 from tabulate import tabulate
 from typing_extensions import Self
 
@@ -560,6 +559,8 @@ def print_version_info() -> None:
     logger = getLogger(__name__)
     latest_version = None
     try:
+        import requests  # Only needed here, and slow to import
+
         response = requests.get(url="https://pypi.org/pypi/data-diff/json", timeout=3)
         response.raise_for_status()
         response_json = response.json()